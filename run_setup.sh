@@ -3,6 +3,10 @@
 # Capture the first argument as the number of deformations
 N_VALUES=${1:-10}
 
+# Capture the optional number of coarse deformations and coarsening factor
+N_COARSE=${2:-0}
+FACTOR=${3:-2}
+
 # Move into the newly created/copied directory
 cd reference_simulation
 
@@ -22,7 +26,8 @@ echo " done."
 # Setup the simulation directories
 echo -n "Setting up simulation directories..."
 cd ..
-python src/deformation.py --n_values "$N_VALUES"
+python src/deformation.py --n_values "$N_VALUES" \
+    --n_coarse "$N_COARSE" --factor "$FACTOR"
 echo " done."
 
 # Run the simulations
@@ -47,6 +52,34 @@ for sim_dir in "openfoam_simulations"/simulation_mu_*; do
     fi
 done
 
+# Run the coarse simulations, if any
+if [ "$N_COARSE" -gt 0 ]; then
+    echo "Running the coarse simulations:"
+
+    # Loop through all coarse directories matching the pattern
+    for sim_dir in "openfoam_simulations_coarse"/simulation_mu_*; do
+
+        if [ -d "$sim_dir" ]; then
+            cd "$sim_dir" || { echo "Failed to enter $sim_dir"; exit 1; }
+
+            echo -n "    Running blockMesh in $sim_dir..."
+            blockMesh > /dev/null 2>&1
+            echo " done."
+
+            touch case.foam
+            echo -n "    Running simpleFoam in $sim_dir..."
+            simpleFoam > /dev/null 2>&1
+            echo " done."
+
+            echo -n "    Converting results to VTK format in $sim_dir..."
+            foamToVTK -latestTime > /dev/null 2>&1
+            echo " done."
+
+            cd - > /dev/null
+        fi
+    done
+fi
+
 # Print completion message
 echo
 echo "Setup completed successfully."
@@ -3,9 +3,17 @@
 # Capture the first argument as the pod rank
 POD_RANK=${1:-10}
 
+# Capture the optional rank of the multi-fidelity correction
+CORRECTION_RANK=${2:-0}
+
+# Capture the optional number of regions and partition of the localized model
+N_REGIONS=${3:-1}
+PARTITION=${4:-kmeans}
+
 # Run the POD analysis
 echo -n "Running the POD analysis..."
-python src/pod.py --pod_rank "$POD_RANK"
+python src/pod.py --pod_rank "$POD_RANK" --correction_rank "$CORRECTION_RANK" \
+    --n_regions "$N_REGIONS" --partition "$PARTITION"
 echo " done."
 
 # Create the test_simulations directory
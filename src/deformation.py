@@ -1,4 +1,4 @@
-from utils import mesh_to_numpy, setup_simulation
+from utils import mesh_to_numpy, setup_simulation, setup_coarse_simulation
 import argparse
 import os
 
@@ -6,6 +6,8 @@ import os
 # Parse command line arguments
 parser = argparse.ArgumentParser()
 parser.add_argument("--n_values", type=int, default=10)
+parser.add_argument("--n_coarse", type=int, default=0)
+parser.add_argument("--factor", type=float, default=2)
 args = parser.parse_args()
 
 # Check that the reference simulation directory exists
@@ -18,3 +20,7 @@ pts = mesh_to_numpy(file=path)
 
 # Set up directories for OpenFOAM simulations
 setup_simulation(pts=pts, header_file=path, n_deformations=args.n_values)
+
+# Set up directories for the coarse OpenFOAM simulations, if requested
+if args.n_coarse > 0:
+    setup_coarse_simulation(n_deformations=args.n_coarse, factor=args.factor)
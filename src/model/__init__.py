@@ -1,6 +1,10 @@
 __all__ = [
+    "LocalPODRBF",
+    "MultiFidelityPODRBF",
     "PODRBF",
 ]
 
 
 from .pod_rbf import PODRBF
+from .local_pod_rbf import LocalPODRBF
+from .multi_fidelity_pod_rbf import MultiFidelityPODRBF
@@ -0,0 +1,186 @@
+import torch
+from .pod_rbf import PODRBF
+
+
+class LocalPODRBF(torch.nn.Module):
+    """
+    Definition of the localized POD-RBF model. The parameter range is split
+    into regions, a compact POD-RBF model is fitted on each region, and the
+    local predictions are blended with a partition of unity across the region
+    boundaries.
+    """
+
+    def __init__(
+        self,
+        pod_rank,
+        rbf_kernel,
+        n_regions=2,
+        overlap=0.1,
+        partition="kmeans",
+    ):
+        """
+        Initialization of the localized POD-RBF model.
+
+        :param int pod_rank: Rank of the POD basis of each local model.
+        :param str rbf_kernel: Kernel of the RBF interpolators.
+        :param int n_regions: Number of regions of the parameter range.
+        :param float overlap: Half-width of the blending band around each
+            region boundary, as a fraction of the parameter range.
+        :param str partition: Strategy used to split the parameter range,
+            either "kmeans" or "intervals".
+        :raises ValueError: If the partition strategy is not supported.
+        """
+        super().__init__()
+
+        # Check the partition strategy
+        if partition not in ("kmeans", "intervals"):
+            raise ValueError(f"Unknown partition strategy: {partition}")
+
+        self.n_regions = n_regions
+        self.overlap = overlap
+        self.partition = partition
+        self.models = torch.nn.ModuleList(
+            [PODRBF(pod_rank, rbf_kernel) for _ in range(n_regions)]
+        )
+        self.register_buffer("boundaries", None)
+        self.width = 0.0
+
+    def forward(self, x):
+        """
+        Forward pass of the localized POD-RBF model.
+        """
+        return self._blend(x, lambda model, x_k: model(x_k))
+
+    def fit(self, p, x):
+        """
+        Fit the localized POD-RBF model to the training data.
+
+        :raises ValueError: If the parameter is not scalar or if a region does
+            not contain enough training samples.
+        """
+        if p.shape[1] != 1:
+            raise ValueError("LocalPODRBF only supports a scalar parameter.")
+
+        # Compute the inner boundaries of the regions
+        if self.partition == "kmeans":
+            centroids = self._kmeans(p.flatten())
+            inner = 0.5 * (centroids[1:] + centroids[:-1])
+        else:
+            inner = torch.linspace(
+                p.min(), p.max(), self.n_regions + 1, dtype=p.dtype
+            )[1:-1]
+
+        # Outermost regions extend to infinity to handle extrapolation
+        inf = torch.tensor([torch.inf], dtype=p.dtype)
+        self.boundaries = torch.cat([-inf, inner.to(p.dtype), inf])
+        self.width = self.overlap * (p.max() - p.min()).item()
+
+        # Fit each local model on the samples of its region and overlap band
+        for k, model in enumerate(self.models):
+            lower = self.boundaries[k] - self.width
+            upper = self.boundaries[k + 1] + self.width
+            idx = (p[:, 0] >= lower) & (p[:, 0] <= upper)
+
+            if idx.sum() < 2:
+                raise ValueError(
+                    f"Region {k} contains {int(idx.sum())} training samples, "
+                    "at least 2 are required. Reduce the number of regions."
+                )
+            model.fit(p[idx], x[idx])
+
+    def register_functional(self, name, weights):
+        """
+        Register a linear functional of the field on every local model.
+
+        :param str name: Name of the functional.
+        :param weights: Weights of the functional, of shape [n_points].
+        :type weights: torch.Tensor | np.ndarray
+        """
+        for model in self.models:
+            model.register_functional(name, weights)
+
+    def evaluate_functionals(self, x):
+        """
+        Evaluate the registered functionals by blending the local projected
+        functionals, without reconstructing the full field.
+
+        :param torch.Tensor x: Parameters of shape [batch, 1].
+        :return: Functionals of shape [batch, n_functionals].
+        :rtype: torch.Tensor
+        """
+        return self._blend(
+            x, lambda model, x_k: model.evaluate_functionals(x_k)
+        )
+
+    def weights(self, x):
+        """
+        Compute the blending weights of the local models.
+
+        :param torch.Tensor x: Parameters of shape [batch, 1].
+        :return: Weights of shape [batch, n_regions], summing to one per row.
+        :rtype: torch.Tensor
+        """
+        # Compute the smooth step associated to each boundary
+        t = x - self.boundaries.to(x.device)
+        if self.width > 0:
+            step = torch.clamp(t / (2 * self.width) + 0.5, 0.0, 1.0)
+        else:
+            step = (t >= 0).to(x.dtype)
+
+        # Differences of consecutive steps form a partition of unity
+        return step[:, :-1] - step[:, 1:]
+
+    def _blend(self, x, evaluate):
+        """
+        Blend the outputs of the local models with their weights.
+
+        :param torch.Tensor x: Parameters of shape [batch, 1].
+        :param callable evaluate: Function evaluating a local model.
+        :return: Blended output of shape [batch, n_outputs].
+        :rtype: torch.Tensor
+        """
+        weights = self.weights(x)
+        output = None
+
+        # Evaluate only the local models with a non-zero weight
+        for k, model in enumerate(self.models):
+            active = weights[:, k] > 0
+            if not active.any():
+                continue
+            pred = weights[active, k : k + 1] * evaluate(model, x[active])
+
+            if output is None:
+                output = torch.zeros(
+                    x.shape[0],
+                    pred.shape[1],
+                    dtype=pred.dtype,
+                    device=x.device,
+                )
+            output[active] += pred
+
+        return output
+
+    def _kmeans(self, p, n_iter=100):
+        """
+        Cluster the scalar parameters with the k-means algorithm.
+
+        :param torch.Tensor p: Parameters of shape [n_samples].
+        :param int n_iter: Maximum number of iterations.
+        :return: Sorted centroids of shape [n_regions].
+        :rtype: torch.Tensor
+        """
+        # Initialize the centroids at evenly spaced quantiles
+        q = torch.linspace(0, 1, self.n_regions + 2, dtype=p.dtype)[1:-1]
+        centroids = torch.quantile(p, q)
+
+        for _ in range(n_iter):
+            labels = torch.argmin((p[:, None] - centroids[None, :]).abs(), 1)
+            new_centroids = centroids.clone()
+            for k in range(self.n_regions):
+                if (labels == k).any():
+                    new_centroids[k] = p[labels == k].mean()
+            if torch.allclose(new_centroids, centroids):
+                break
+            centroids = new_centroids
+
+        return torch.sort(centroids).values
@@ -0,0 +1,69 @@
+import torch
+from .pod_rbf import PODRBF
+
+
+class MultiFidelityPODRBF(torch.nn.Module):
+    """
+    Definition of the multi-fidelity POD-RBF model. A coarse POD-RBF model is
+    fitted on many cheap coarse simulations, transferred to the fine mesh, and
+    a low-rank POD-RBF correction is fitted on the discrepancy between a few
+    fine simulations and the coarse model.
+    """
+
+    def __init__(self, pod_rank, rbf_kernel, correction_rank):
+        """
+        Initialization of the multi-fidelity POD-RBF model.
+
+        :param int pod_rank: Rank of the POD basis of the coarse model.
+        :param str rbf_kernel: Kernel of the RBF interpolators.
+        :param int correction_rank: Rank of the POD basis of the correction.
+        """
+        super().__init__()
+        self.coarse = PODRBF(pod_rank, rbf_kernel)
+        self.correction = PODRBF(correction_rank, rbf_kernel)
+
+    def forward(self, x):
+        """
+        Forward pass of the multi-fidelity POD-RBF model.
+        """
+        return self.coarse(x) + self.correction(x)
+
+    def fit(self, p, x, p_coarse, x_coarse):
+        """
+        Fit the multi-fidelity POD-RBF model to the training data.
+
+        :param torch.Tensor p: Parameters of the fine simulations.
+        :param torch.Tensor x: Fields of the fine simulations.
+        :param torch.Tensor p_coarse: Parameters of the coarse simulations.
+        :param torch.Tensor x_coarse: Fields of the coarse simulations,
+            transferred to the fine mesh.
+        """
+        self.coarse.fit(p_coarse, x_coarse)
+
+        # Fit the correction on the fine-minus-coarse discrepancy
+        with torch.no_grad():
+            discrepancy = x - self.coarse(p)
+        self.correction.fit(p, discrepancy)
+
+    def register_functional(self, name, weights):
+        """
+        Register a linear functional of the field on both models.
+
+        :param str name: Name of the functional.
+        :param weights: Weights of the functional, of shape [n_points].
+        :type weights: torch.Tensor | np.ndarray
+        """
+        self.coarse.register_functional(name, weights)
+        self.correction.register_functional(name, weights)
+
+    def evaluate_functionals(self, x):
+        """
+        Evaluate the registered functionals as the sum of the coarse and
+        correction contributions, without reconstructing the full field.
+
+        :param torch.Tensor x: Parameters of shape [batch, n_params].
+        :return: Functionals of shape [batch, n_functionals].
+        :rtype: torch.Tensor
+        """
+        coarse = self.coarse.evaluate_functionals(x)
+        return coarse + self.correction.evaluate_functionals(x)
@@ -14,6 +14,10 @@ class PODRBF(torch.nn.Module):
         super().__init__()
         self.pod = PODBlock(pod_rank)
         self.rbf = RBFBlock(kernel=rbf_kernel)
+        self.functionals = {}
+        self._fitted = False
+        self._functional_matrix = None
+        self._functional_offset = None
 
     def forward(self, x):
         """
@@ -28,3 +32,59 @@ class PODRBF(torch.nn.Module):
         """
         self.pod.fit(x)
         self.rbf.fit(p, self.pod.reduce(x))
+        self._fitted = True
+
+        # Project the registered functionals onto the new POD basis
+        if self.functionals:
+            self._project_functionals()
+
+    def register_functional(self, name, weights):
+        """
+        Register a linear functional of the field, defined by one weight per
+        mesh point. The functional is projected onto the POD basis, so that it
+        can be evaluated without reconstructing the full field.
+
+        :param str name: Name of the functional.
+        :param weights: Weights of the functional, of shape [n_points].
+        :type weights: torch.Tensor | np.ndarray
+        """
+        self.functionals[name] = torch.as_tensor(
+            weights, dtype=torch.float32
+        ).flatten()
+
+        # If the model is already fitted, update the projected functionals
+        if self._fitted:
+            self._project_functionals()
+
+    def evaluate_functionals(self, x):
+        """
+        Evaluate the registered functionals directly from the POD
+        coefficients, in O(batch x rank x n_functionals) operations.
+
+        :param torch.Tensor x: Parameters of shape [batch, n_params].
+        :return: Functionals of shape [batch, n_functionals], ordered as in
+            `functionals`.
+        :rtype: torch.Tensor
+        :raises RuntimeError: If no functional has been registered.
+        """
+        if self._functional_matrix is None:
+            raise RuntimeError("No functional registered on a fitted model.")
+
+        coefficients = self.rbf(x)
+        return coefficients @ self._functional_matrix + self._functional_offset
+
+    def _project_functionals(self):
+        """
+        Project the registered functionals onto the POD basis.
+        """
+        # The expansion is affine in the coefficients: field = c @ A + b
+        rank = self.pod.basis.shape[0]
+        dtype = self.pod.basis.dtype
+        offset = self.pod.expand(torch.zeros(1, rank, dtype=dtype))
+        modes = self.pod.expand(torch.eye(rank, dtype=dtype)) - offset
+
+        # Stack the functional weights and project them
+        weights = torch.stack(list(self.functionals.values()), dim=1)
+        weights = weights.to(dtype)
+        self._functional_matrix = modes @ weights
+        self._functional_offset = offset @ weights
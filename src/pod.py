@@ -1,5 +1,5 @@
 from pina.problem.zoo import SupervisedProblem
-from model import PODRBF
+from model import PODRBF, LocalPODRBF, MultiFidelityPODRBF
 import numpy as np
 import argparse
 import warnings
@@ -10,17 +10,32 @@ import os
 from utils import (
     mesh_to_numpy,
     get_training_data,
+    get_coarse_training_data,
     plot_singular_values,
     compute_deformation,
     plot_test,
+    region_functional,
 )
 
 
 # Parse command line arguments
 parser = argparse.ArgumentParser()
 parser.add_argument("--pod_rank", type=int, default=10)
+parser.add_argument("--n_regions", type=int, default=1)
+parser.add_argument("--overlap", type=float, default=0.1)
+parser.add_argument(
+    "--partition", type=str, default="kmeans", choices=["kmeans", "intervals"]
+)
+parser.add_argument("--correction_rank", type=int, default=0)
 args = parser.parse_args()
 
+# Check that the multi-fidelity and localized models are not combined
+if args.correction_rank > 0 and args.n_regions > 1:
+    raise ValueError(
+        "The multi-fidelity model (--correction_rank > 0) cannot be combined "
+        "with the localized model (--n_regions > 1)."
+    )
+
 # Suppress warnings and create directories if they don't exist
 warnings.filterwarnings("ignore")
 os.makedirs("test", exist_ok=True)
@@ -33,6 +48,10 @@ vel, params, pts = get_training_data()
 path = "reference_simulation/constant/polyMesh/points"
 original_pts = mesh_to_numpy(file=path)
 
+# Load the coarse data transferred to the fine mesh, if multi-fidelity
+if args.correction_rank > 0:
+    vel_coarse, params_coarse = get_coarse_training_data(pts=original_pts)
+
 # Compute and plot the singular values
 plot_singular_values(vel=vel, pts=original_pts)
 
@@ -50,23 +69,68 @@ compute_deformation(
 test_mesh = mesh_to_numpy(file="test/points")
 mu_tensor = torch.tensor(random_mu, dtype=torch.float32).reshape(-1, 1)
 
+# Define the quantities of interest on the reference mesh. The model predicts
+# the velocity magnitude, so the outlet flux (the integral of the normal
+# component over an outlet whose height depends on mu) is not a fixed linear
+# functional of the field: mean velocity magnitudes are used instead.
+inlet = region_functional(pts=original_pts, x_range=(0, 0))
+outlet = region_functional(pts=original_pts, x_range=(22, 22))
+recirculation = region_functional(
+    pts=original_pts, x_range=(4, 10), y_range=(0, 2)
+)
+functionals = {
+    "inlet_mean_velocity": inlet,
+    "outlet_mean_velocity": outlet,
+    "recirculation_mean_velocity": recirculation,
+    "recirculation_velocity_deficit": inlet - recirculation,
+}
+
 # Define the problem
 problem = SupervisedProblem(input_=params, output_=vel)
 
 # Loop over the rank values
 for rank in range(1, args.pod_rank + 1):
 
-    # Create the PODRBF model
-    pod_rbf = PODRBF(pod_rank=rank, rbf_kernel="thin_plate_spline")
-    pod_rbf.fit(p=params, x=vel)
+    # Create the PODRBF model: multi-fidelity if a correction rank is given,
+    # localized if more than one region is requested, global otherwise
+    fit_kwargs = {}
+    if args.correction_rank > 0:
+        pod_rbf = MultiFidelityPODRBF(
+            pod_rank=rank,
+            rbf_kernel="thin_plate_spline",
+            correction_rank=args.correction_rank,
+        )
+        fit_kwargs = {"p_coarse": params_coarse, "x_coarse": vel_coarse}
+    elif args.n_regions > 1:
+        pod_rbf = LocalPODRBF(
+            pod_rank=rank,
+            rbf_kernel="thin_plate_spline",
+            n_regions=args.n_regions,
+            overlap=args.overlap,
+            partition=args.partition,
+        )
+    else:
+        pod_rbf = PODRBF(pod_rank=rank, rbf_kernel="thin_plate_spline")
+
+    # Register the quantities of interest and fit the model
+    for name, weights in functionals.items():
+        pod_rbf.register_functional(name=name, weights=weights)
+    pod_rbf.fit(p=params, x=vel, **fit_kwargs)
 
     # Make the prediction for the random mu
     pred = pod_rbf(mu_tensor).detach().flatten().numpy()
+    qoi = pod_rbf.evaluate_functionals(mu_tensor).detach().flatten().numpy()
 
     # Plot the predicted velocity magnitude for the random mu
     prediction_img = f"test/img/predicted_velocity_rank{rank}.png"
     plot_test(vel=pred, pts=test_mesh, file=prediction_img)
 
-    # Save results to a file (param and velocity magnitude)
+    # Save results to a file (param, velocity magnitude and QoIs)
     filename = f"test/pod_results_rank{rank}.npz"
-    np.savez(file=filename, param=mu_tensor.numpy(), velocity=pred)
+    np.savez(
+        file=filename,
+        param=mu_tensor.numpy(),
+        velocity=pred,
+        qoi=qoi,
+        qoi_names=list(functionals),
+    )
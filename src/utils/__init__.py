@@ -1,28 +1,47 @@
 __all__ = [
+    "change_resolution",
     "change_vertices",
     "compute_deformation",
+    "create_cases",
+    "deform_points",
+    "get_coarse_training_data",
     "get_mask",
     "get_mu",
     "get_test_data",
     "get_training_data",
+    "mask_functional",
     "mean_squared_error",
     "mesh_to_numpy",
     "plot_mesh",
     "plot_singular_values",
     "plot_test",
+    "region_functional",
     "relative_error",
+    "setup_coarse_simulation",
     "setup_simulation",
     "split_by_label",
+    "transfer_field",
 ]
 
 
 from .plotter import plot_mesh, plot_singular_values, plot_test
-from .data import get_training_data, get_test_data, get_mu
+from .data import (
+    get_training_data,
+    get_coarse_training_data,
+    get_test_data,
+    get_mu,
+    transfer_field,
+)
+from .functionals import mask_functional, region_functional
 from .test_tools import relative_error, split_by_label, mean_squared_error
 from .mesh import (
     mesh_to_numpy,
     setup_simulation,
     compute_deformation,
+    create_cases,
     get_mask,
     change_vertices,
+    change_resolution,
+    deform_points,
+    setup_coarse_simulation,
 )
@@ -1,3 +1,5 @@
+from scipy.interpolate import griddata
+from .mesh import deform_points
 from glob import glob
 import numpy as np
 import pyvista
@@ -6,16 +8,16 @@ import re
 import os
 
 
-def get_training_data():
+def get_training_data(base_dir="openfoam_simulations"):
     """
     Load the training data from the VTK files of the OpenFOAM simulations.
     It returns the velocity magnitudes and the corresponding mu parameters as
     tensors of shape [n_simulations, n_points] and [n_simulations, 1]
     respectively. It also returns the mesh points as a NumPy array.
-    """
-    # Define the base directory for OpenFOAM simulations
-    base_dir = "openfoam_simulations"
 
+    :param str base_dir: Directory of the OpenFOAM simulations.
+        Default is "openfoam_simulations".
+    """
     # Initialize lists to store data and parameters
     all_data = []
     all_points = []
@@ -56,6 +58,58 @@ def get_training_data():
     return vel_magnitudes, params, mesh_points
 
 
+def get_coarse_training_data(pts, base_dir="openfoam_simulations_coarse"):
+    """
+    Load the training data of the coarse OpenFOAM simulations and transfer
+    the velocity magnitudes to the fine mesh deformed with the same mu.
+
+    :param np.ndarray pts: Reference fine mesh points, corresponding to mu = 0.
+    :param str base_dir: Directory of the coarse OpenFOAM simulations.
+        Default is "openfoam_simulations_coarse".
+    :return: Velocity magnitudes on the fine mesh and mu parameters as
+        tensors of shape [n_simulations, n_points] and [n_simulations, 1].
+    :rtype: tuple
+    """
+    vel, params, mesh_points = get_training_data(base_dir=base_dir)
+
+    # Transfer each coarse field to the corresponding deformed fine mesh
+    transferred = []
+    for v, mu, coarse_pts in zip(vel.numpy(), params.numpy(), mesh_points):
+        fine_pts = deform_points(mu=mu.item(), pts=pts)
+        transferred.append(transfer_field(v, coarse_pts, fine_pts))
+
+    vel_magnitudes = torch.tensor(np.vstack(transferred), dtype=torch.float32)
+
+    return vel_magnitudes, params
+
+
+def transfer_field(vel, src_pts, dst_pts):
+    """
+    Transfer a field between two meshes by linear interpolation in the
+    (x, y) plane. Points of the target mesh falling outside the source mesh
+    take the value of the nearest source point.
+
+    :param np.ndarray vel: Field values at the source points.
+    :param np.ndarray src_pts: Source mesh points as a NumPy array.
+    :param np.ndarray dst_pts: Target mesh points as a NumPy array.
+    :return: Field values at the target points.
+    :rtype: np.ndarray
+    """
+    # Keep a single z-plane, since the simulations are two-dimensional
+    plane = src_pts[:, 2] == src_pts[:, 2].min()
+    src_xy, src_vel = src_pts[plane, :2], vel[plane]
+
+    # Interpolate linearly and fill the points outside the convex hull
+    out = griddata(src_xy, src_vel, dst_pts[:, :2], method="linear")
+    outside = np.isnan(out)
+    if outside.any():
+        out[outside] = griddata(
+            src_xy, src_vel, dst_pts[outside, :2], method="nearest"
+        )
+
+    return out
+
+
 def get_test_data():
     """
     Load the test data from the VTK files of the test OpenFOAM simulations.
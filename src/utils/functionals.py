@@ -0,0 +1,70 @@
+import numpy as np
+
+
+def mask_functional(mask, weights=None):
+    """
+    Build the weights of a linear functional supported on a point mask. If no
+    weights are given, the functional is the mean over the masked points.
+
+    :param np.ndarray mask: Boolean mask over the mesh points.
+    :param np.ndarray weights: Weights of the masked points, in the order of
+        the masked points. Default is None.
+    :return: Weights of the functional over all mesh points.
+    :rtype: np.ndarray
+    :raises ValueError: If the mask is empty or the weights do not match it.
+    """
+    mask = np.asarray(mask, dtype=bool)
+    n_masked = int(mask.sum())
+
+    # Check that the mask selects at least one point
+    if n_masked == 0:
+        raise ValueError("The mask does not select any mesh point.")
+
+    # Default to the mean over the masked points
+    if weights is None:
+        weights = np.full(n_masked, 1.0 / n_masked)
+
+    weights = np.asarray(weights, dtype=float)
+    if weights.shape != (n_masked,):
+        raise ValueError(
+            f"Expected {n_masked} weights, got {weights.shape[0]} instead."
+        )
+
+    # Scatter the weights over all mesh points
+    functional = np.zeros(mask.shape[0])
+    functional[mask] = weights
+
+    return functional
+
+
+def region_functional(
+    pts, x_range=None, y_range=None, average=True, tol=1e-6
+):
+    """
+    Build the weights of a linear functional over a rectangular region of the
+    reference mesh. Bounds are inclusive up to a tolerance, so patches such as
+    the inlet can be selected with a degenerate range, e.g. x_range=(0, 0).
+
+    :param np.ndarray pts: Reference mesh points as a NumPy array.
+    :param tuple x_range: Bounds of the region along x. Default is None.
+    :param tuple y_range: Bounds of the region along y. Default is None.
+    :param bool average: If True, the functional is the mean over the region,
+        otherwise the sum. Default is True.
+    :param float tol: Tolerance applied to the bounds. Default is 1e-6.
+    :return: Weights of the functional over all mesh points.
+    :rtype: np.ndarray
+    """
+    mask = np.ones(pts.shape[0], dtype=bool)
+
+    # Restrict the mask to the requested bounds, up to the tolerance
+    if x_range is not None:
+        mask &= (pts[:, 0] >= x_range[0] - tol) & (
+            pts[:, 0] <= x_range[1] + tol
+        )
+    if y_range is not None:
+        mask &= (pts[:, 1] >= y_range[0] - tol) & (
+            pts[:, 1] <= y_range[1] + tol
+        )
+
+    weights = None if average else np.ones(int(mask.sum()))
+    return mask_functional(mask, weights)
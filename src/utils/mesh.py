@@ -53,19 +53,46 @@ def setup_simulation(pts, header_file, n_deformations):
     :param str header_file: Path to the header file for OpenFOAM.
     :param int n_deformations: Number of deformations to create.
     """
-    # Define the base directory and reference directory
-    reference_dir = "reference_simulation"
+    # Define the base directory and image directory
     simulation_dir = "openfoam_simulations"
     img_dir = "openfoam_simulations/img"
+    os.makedirs(img_dir, exist_ok=True)
+
+    # Create the directories for the OpenFOAM simulations
+    cases = create_cases(
+        n_deformations=n_deformations, simulation_dir=simulation_dir
+    )
+    for mu, sim_dir in cases:
+
+        # Compute and save the deformation
+        file = os.path.join(sim_dir, "constant/polyMesh/points")
+        compute_deformation(
+            mu=mu, pts=pts, img_dir=img_dir, file=file, header_file=header_file
+        )
+
+
+def create_cases(n_deformations, simulation_dir):
+    """
+    Sample the deformation parameters and create one case directory per
+    parameter by copying the reference simulation.
+
+    :param int n_deformations: Number of random deformations to create. The
+        extreme parameters -1 and 1 are always added.
+    :param str simulation_dir: Base directory of the case directories.
+    :return: List of (mu, case directory) pairs.
+    :rtype: list
+    """
+    # Define the reference directory
+    reference_dir = "reference_simulation"
 
     # Create required directories if they don't exist
     os.makedirs(simulation_dir, exist_ok=True)
-    os.makedirs(img_dir, exist_ok=True)
 
-    # Create a list of 10 deformation parameters
+    # Create a list of deformation parameters, including the extremes
     values = [random.uniform(-1, 1) for _ in range(n_deformations)] + [-1, 1]
 
-    # Create the directories for the OpenFOAM simulations
+    # Create the case directories
+    cases = []
     for mu in values:
 
         # Format the folder name
@@ -80,11 +107,9 @@ def setup_simulation(pts, header_file, n_deformations):
         with open(os.path.join(sim_dir, "parameter.txt"), "w") as f:
             f.write(f"Deformation parameter along the y direction: {mu}\n")
 
-        # Compute and save the deformation
-        file = os.path.join(sim_dir, "constant/polyMesh/points")
-        compute_deformation(
-            mu=mu, pts=pts, img_dir=img_dir, file=file, header_file=header_file
-        )
+        cases.append((mu, sim_dir))
+
+    return cases
 
 
 def compute_deformation(mu, pts, img_dir, file, header_file):
@@ -97,6 +122,26 @@ def compute_deformation(mu, pts, img_dir, file, header_file):
     :param str file: Path to the target points file.
     :param str header_file: Path to the header file for OpenFOAM.
     """
+    # Compute the new mesh and plot the original and deformed meshes
+    new_mesh = deform_points(mu=mu, pts=pts)
+    image = f"{img_dir}/mesh_{mu}.png"
+    plot_mesh(pts=new_mesh, clr="red", title="Deformed Mesh", file=image)
+
+    # Create OpenFOAM handler and write the deformed mesh
+    of_handler = OpenFoamHandler()
+    of_handler.write_points(new_mesh, file, header_file)
+
+
+def deform_points(mu, pts):
+    """
+    Deform the mesh points by moving the upper boundary by mu in the
+    y-direction with an RBF interpolation.
+
+    :param float mu: Deformation parameter to apply.
+    :param np.ndarray pts: Mesh points as a NumPy array.
+    :return: Deformed mesh points.
+    :rtype: np.ndarray
+    """
     # Define the control points
     ctrl_pts = pts[get_mask(pts)]
 
@@ -105,17 +150,10 @@ def compute_deformation(mu, pts, img_dir, file, header_file):
     deformed_ctrl_pts = ctrl_pts.copy()
     deformed_ctrl_pts[deformed_ctrl_pts[:, 1] == 5, 1] += mu
 
-    # Define the RBF interpolator
+    # Define the RBF interpolator and deform the points
     rbf = RBF(original_ctrl_pts, deformed_ctrl_pts, radius=100)
 
-    # Compute the new mesh and plot the original and deformed meshes
-    new_mesh = rbf(pts)
-    image = f"{img_dir}/mesh_{mu}.png"
-    plot_mesh(pts=new_mesh, clr="red", title="Deformed Mesh", file=image)
-
-    # Create OpenFOAM handler and write the deformed mesh
-    of_handler = OpenFoamHandler()
-    of_handler.write_points(new_mesh, file, header_file)
+    return rbf(pts)
 
 
 def get_mask(pts):
@@ -134,6 +172,74 @@ def get_mask(pts):
     return bottom | top | left
 
 
+def setup_coarse_simulation(n_deformations, factor):
+    """
+    Setup the coarse OpenFOAM simulation directories, replacing any previous
+    coarse case. The resolution of the blocks is reduced by the coarsening
+    factor and the geometry is deformed by moving the upper vertices of the
+    blockMeshDict, so that the mesh is generated by blockMesh.
+
+    :param int n_deformations: Number of deformations to create.
+    :param float factor: Coarsening factor of the block cell counts.
+    """
+    # Remove the previous coarse cases, so that the blocks are never coarsened
+    # twice and all the cases share the same coarsening factor
+    simulation_dir = "openfoam_simulations_coarse"
+    shutil.rmtree(simulation_dir, ignore_errors=True)
+
+    # Create the directories for the coarse OpenFOAM simulations
+    cases = create_cases(
+        n_deformations=n_deformations, simulation_dir=simulation_dir
+    )
+    for mu, sim_dir in cases:
+
+        # Coarsen and deform the blocks
+        file = os.path.join(sim_dir, "system/blockMeshDict")
+        change_resolution(file=file, factor=factor)
+        change_vertices(file=file, mu=mu)
+
+
+def change_resolution(file, factor):
+    """
+    Divide the number of cells of each block by the coarsening factor in the
+    x and y directions, keeping a single cell in the z-direction.
+
+    :param str file: Path to the blockMeshDict file.
+    :param float factor: Coarsening factor of the block cell counts.
+    :raises ValueError: If the coarsening factor is not positive.
+    """
+    if factor <= 0:
+        raise ValueError(f"Coarsening factor must be positive, got {factor}.")
+
+    # Open the blockMeshDict file and read its contents
+    with open(file, "r") as f:
+        lines = f.readlines()
+
+    # Modify the cell counts of the hex blocks
+    new_lines = []
+    for line in lines:
+
+        # Match lines like: hex (...) (nx ny nz) rest and capture them
+        m = re.match(
+            r"(\s*hex\s*\([\d\s]+\)\s*)\(\s*(\d+)\s+(\d+)\s+(\d+)\s*\)(.*)",
+            line,
+        )
+        if m:
+            nx = max(1, round(int(m.group(2)) / factor))
+            ny = max(1, round(int(m.group(3)) / factor))
+            nz = int(m.group(4))
+            rest = m.group(5)
+
+            new_line = f"{m.group(1)}({nx} {ny} {nz}){rest}\n"
+            new_lines.append(new_line)
+        else:
+            new_lines.append(line)
+
+    # Write the modified lines back to the file
+    with open(file, "w") as f:
+        f.writelines(new_lines)
+
+
 def change_vertices(file, mu):
     """
     Move the upper vertices of the mesh by mu in the y-direction.